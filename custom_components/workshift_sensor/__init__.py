@@ -3,39 +3,65 @@ from __future__ import annotations
 
 import logging
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 
+from .schedule import WorkshiftSchedule, async_get_default_shift_label
+
 DOMAIN = "workshift_sensor"
 PLATFORMS: list[str] = ["sensor", "binary_sensor", "calendar"]
+# Entry data key holding the WorkshiftSchedule shared by all platforms
+DATA_SCHEDULE = "_schedule"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Localized default shift labels keyed by Home Assistant language
+_DEFAULT_LABEL_CACHE: dict[str, str] = {}
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up via YAML (not supported)."""
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Workshift Sensor from a config entry."""
-    from .schedule import async_get_default_shift_label
-
     config: dict = {**entry.data, **entry.options}
     
     # FIX #3: Error handling for translation loading
-    try:
-        config["default_shift_label"] = await async_get_default_shift_label(hass)
-    except Exception as err:
-        _LOGGER.warning(
-            "Failed to load localized shift label, using fallback 'Shift': %s", 
-            err
-        )
-        config["default_shift_label"] = "Shift"
-    
+    language = hass.config.language
+    label = _DEFAULT_LABEL_CACHE.get(language)
+    if label is None:
+        try:
+            label = await async_get_default_shift_label(hass)
+        except Exception as err:
+            _LOGGER.warning(
+                "Failed to load localized shift label, using fallback 'Shift': %s", 
+                err
+            )
+            label = "Shift"
+        else:
+            _DEFAULT_LABEL_CACHE[language] = label
+    config["default_shift_label"] = label
+
+    # Parse the entry once instead of once per entity
+    config[DATA_SCHEDULE] = WorkshiftSchedule(hass, config)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = config
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     # FIX #2: Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    @callback
+    def _async_core_config_updated(event: Event) -> None:
+        """Reload when the Home Assistant time zone changes."""
+        if "time_zone" not in event.data:
+            return
+        if str(config[DATA_SCHEDULE].tz) != hass.config.time_zone:
+            hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _async_core_config_updated)
+    )
     
     return True
 
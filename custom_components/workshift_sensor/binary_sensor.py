@@ -3,15 +3,18 @@ from datetime import datetime
 from typing import Callable, Optional
 import logging
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import DEFAULT_TIME_ZONE
 
-from . import DOMAIN
-from .schedule import WorkshiftSchedule
+from . import DATA_SCHEDULE, DOMAIN
+from .schedule import WorkshiftSchedule, seconds_until
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,71 +36,101 @@ class WorkshiftActiveSensor(BinarySensorEntity):
         self._config = hass.data[DOMAIN][entry.entry_id]
         self._attr_name = f"{name_prefix} Active"
         self._attr_unique_id = f"{entry.entry_id}_active"
-        self._schedule = WorkshiftSchedule(hass, self._config)
+        self._schedule: WorkshiftSchedule = self._config[DATA_SCHEDULE]
         self._tz = self._schedule.tz
         # Timer for scheduled state changes
         self._timer_cancel: Optional[Callable[[], None]] = None
+        self._pending_target: Optional[datetime] = None
+        self._workday_cancel: Optional[Callable[[], None]] = None
+        self._timer_job = HassJob(
+            self._timer_trigger,
+            "workshift active sensor transition",
+            cancel_on_shutdown=True,
+        )
         self._attr_is_on = False  # initial state
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=self._config.get("name") or entry.title or "Workshift",
+            manufacturer="Workshift Sensor",
+        )
 
     async def async_added_to_hass(self):
         """When added, determine initial state and set up timers."""
-        # Set initial state
-        self._attr_is_on = self._is_shift_active_now()
-        # Schedule the next state change
-        self._schedule_next_event()
+        # Set initial state and schedule the next state change
+        now = dt_util.now(self._tz)
+        self._attr_is_on, target_time = self._evaluate(now)
+        self._schedule_next_event(now, target_time)
         # Write initial state
         self.async_write_ha_state()
 
+        entities = self._schedule.workday_entities
+        if entities:
+            self._workday_cancel = async_track_state_change_event(
+                self.hass, entities, self._handle_workday_state_change
+            )
+
     async def async_will_remove_from_hass(self):
         """Cancel any scheduled timers on removal."""
         if self._timer_cancel:
             self._timer_cancel()
             self._timer_cancel = None
+        self._pending_target = None
+        if self._workday_cancel:
+            self._workday_cancel()
+            self._workday_cancel = None
 
-    def _is_shift_active_now(self) -> bool:
-        """Check if currently within any active shift interval."""
-        now = dt_util.now(self._tz)
-        return self._schedule.shift_covering(now) is not None
+    def _evaluate(self, now: datetime) -> tuple[bool, Optional[datetime]]:
+        """Return whether a shift is active at now and when the state flips next."""
+        shift = self._schedule.shift_covering(now)
+        if shift is not None:
+            return True, shift.end
+        # Currently off: the next transition is the next shift start
+        shift = self._schedule.next_shift_after(now)
+        return False, shift.start if shift else None
 
-    def _schedule_next_event(self):
+    def _schedule_next_event(self, now: datetime, target_time: Optional[datetime]):
         """Schedule the next on/off state transition."""
+        # Keep the pending timer when it already targets the same moment
+        if self._timer_cancel and target_time == self._pending_target:
+            return
         # Cancel any existing timer
         if self._timer_cancel:
             self._timer_cancel()
             self._timer_cancel = None
-        now = dt_util.now(self._tz)
-        target_time = None
-        if self._attr_is_on:
-            active_shift = self._schedule.shift_covering(now)
-            if active_shift:
-                target_time = active_shift.end
-            if target_time:
-                _LOGGER.debug("Scheduling shift end at %s", target_time)
-                self._timer_cancel = async_track_point_in_utc_time(self.hass, self._timer_trigger, dt_util.as_utc(target_time))
-        else:
-            # Currently off: schedule next shift start
-            next_shift = self._schedule.next_shift_after(now)
-            if next_shift:
-                target_time = next_shift.start
-            if target_time:
-                _LOGGER.debug("Scheduling shift start at %s", target_time)
-                self._timer_cancel = async_track_point_in_utc_time(self.hass, self._timer_trigger, dt_util.as_utc(target_time))
+        self._pending_target = target_time
+        if target_time is None:
+            return
+        _LOGGER.debug(
+            "Scheduling shift %s at %s",
+            "end" if self._attr_is_on else "start",
+            target_time,
+        )
+        self._timer_cancel = async_call_later(
+            self.hass, seconds_until(target_time, now), self._timer_job
+        )
 
     @callback
-    def _timer_trigger(self, _now: datetime):
+    def _timer_trigger(self, _fired_at: datetime):
         """Handle a scheduled state change event."""
-        # Update the current state
-        self._attr_is_on = self._is_shift_active_now()
-        self.async_write_ha_state()
-        # Schedule the next transition
-        self._schedule_next_event()
+        # The timer has fired, so it must be re-armed even for the same target
+        self._timer_cancel = None
+        self._pending_target = None
+        # Update the current state and schedule the next transition
+        now = dt_util.now(self._tz)
+        is_on, target_time = self._evaluate(now)
+        changed = is_on != self._attr_is_on
+        self._attr_is_on = is_on
+        if changed:
+            self.async_write_ha_state()
+        self._schedule_next_event(now, target_time)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        name = self._config.get("name") or self._entry.title or "Workshift"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=name,
-            manufacturer="Workshift Sensor",
-        )
+    @callback
+    def _handle_workday_state_change(self, _event) -> None:
+        """Re-evaluate the shift when a workday sensor changes."""
+        now = dt_util.now(self._tz)
+        is_on, target_time = self._evaluate(now)
+        changed = is_on != self._attr_is_on
+        self._attr_is_on = is_on
+        self._schedule_next_event(now, target_time)
+        if changed:
+            self.async_write_ha_state()
@@ -1,24 +1,27 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import Callable, List, Optional
 import logging
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import UTC
 
-from . import DOMAIN
-from .schedule import ShiftInstance, WorkshiftSchedule
+from . import DATA_SCHEDULE, DOMAIN
+from .schedule import ShiftInstance, WorkshiftSchedule, seconds_until
 
 _LOGGER = logging.getLogger(__name__)
 
 # FIX #6: Maximum calendar query range
 MAX_CALENDAR_RANGE_DAYS = 90
 
+# Upper bound for formatted events kept per calendar entity
+EVENT_CACHE_SIZE = 128
+
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Set up the workshift calendar entity."""
@@ -38,13 +41,22 @@ class WorkshiftCalendarEntity(CalendarEntity):
         self.hass = hass
         self._entry = entry
         self._config = hass.data[DOMAIN][entry.entry_id]
-        self._schedule = WorkshiftSchedule(hass, self._config)
+        self._schedule: WorkshiftSchedule = self._config[DATA_SCHEDULE]
+        self._tz = self._schedule.tz
         self._name_prefix = name_prefix
         self._attr_name = f"{name_prefix} Schedule"
         self._attr_unique_id = f"{entry.entry_id}_calendar"
         self._cancel_refresh: Optional[Callable[[], None]] = None
+        self._refresh_job = HassJob(
+            self._refresh, "workshift calendar refresh", cancel_on_shutdown=True
+        )
         self._attr_event: CalendarEvent | None = None
-        self._device_name = base_name
+        self._event_cache: dict[tuple[int, int], CalendarEvent] = {}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=base_name,
+            manufacturer="Workshift Sensor",
+        )
 
     async def async_added_to_hass(self):
         """Initialize state and schedule refreshes."""
@@ -59,8 +71,10 @@ class WorkshiftCalendarEntity(CalendarEntity):
     @callback
     def _refresh(self, *_):
         """Update the current/next event and plan the following refresh."""
-        self._attr_event = self._compute_current_event()
-        self.async_write_ha_state()
+        event = self._compute_current_event()
+        if event != self._attr_event:
+            self._attr_event = event
+            self.async_write_ha_state()
         self._schedule_refresh()
 
     @property
@@ -70,7 +84,7 @@ class WorkshiftCalendarEntity(CalendarEntity):
 
     def _compute_current_event(self) -> CalendarEvent | None:
         """Compute the ongoing or next upcoming shift event."""
-        now = dt_util.now(self._schedule.tz)
+        now = dt_util.now(self._tz)
         active_shift = self._schedule.shift_covering(now)
         if active_shift:
             return self._format_event(active_shift)
@@ -86,7 +100,7 @@ class WorkshiftCalendarEntity(CalendarEntity):
             self._cancel_refresh()
             self._cancel_refresh = None
 
-        now = dt_util.now(self._schedule.tz)
+        now = dt_util.now(self._tz)
         target = None
         if self._attr_event:
             if self._attr_event.start <= now < self._attr_event.end:
@@ -95,11 +109,13 @@ class WorkshiftCalendarEntity(CalendarEntity):
                 target = self._attr_event.start
 
         if target is None:
-            target = dt_util.start_of_local_day(now + timedelta(days=1))
-        self._cancel_refresh = async_track_point_in_utc_time(
+            target = datetime.combine(
+                now.date() + timedelta(days=1), time.min, self._tz
+            )
+        self._cancel_refresh = async_call_later(
             self.hass,
-            self._refresh,
-            dt_util.as_utc(target + timedelta(seconds=1)),
+            seconds_until(target, now) + 1,
+            self._refresh_job,
         )
 
     async def async_get_events(
@@ -108,7 +124,7 @@ class WorkshiftCalendarEntity(CalendarEntity):
         """
         Return dynamically generated events within a time range.
         
-        FIX #6: Limit range and use executor for long computations.
+        FIX #6: Limit range of the computation.
         """
         start = self._ensure_local(start_date)
         end = self._ensure_local(end_date)
@@ -122,60 +138,45 @@ class WorkshiftCalendarEntity(CalendarEntity):
                 MAX_CALENDAR_RANGE_DAYS
             )
             end = start + timedelta(days=MAX_CALENDAR_RANGE_DAYS)
-        
-        # For large ranges (>30 days) use executor
-        if range_days > 30:
-            return await hass.async_add_executor_job(
-                self._compute_events_blocking, start, end
-            )
-        
-        return self._compute_events_blocking(start, end)
 
-    def _compute_events_blocking(
-        self, start: datetime, end: datetime
-    ) -> List[CalendarEvent]:
-        """
-        Blocking computation of calendar events.
-        
-        FIX #6: Extracted for executor usage.
-        """
-        events: list[CalendarEvent] = []
-
-        start_day = start.date()
-        end_day = end.date()
-        total_days = (end_day - start_day).days
-        
-        for offset in range(-1, total_days + 2):
-            day = start_day + timedelta(days=offset)
-            shift = self._schedule.get_shift(day)
-            if shift is None:
-                continue
-            if shift.end <= start or shift.start >= end:
-                continue
-            events.append(self._format_event(shift))
-        
-        return events
+        # Stays on the event loop: the shift and event caches are not thread-safe
+        return [
+            self._format_event(shift)
+            for shift in self._schedule.shifts_between(start, end)
+        ]
 
     def _format_event(self, shift: ShiftInstance) -> CalendarEvent:
         """Convert a shift instance to a CalendarEvent."""
+        key = (shift.start.toordinal(), shift.code)
+        cached = self._event_cache.get(key)
+        if cached is not None:
+            return cached
         description = (
             f"Integration: {DOMAIN}\n"
             f"Schedule: {self._config.get('schedule', '')}\n"
             f"Rotation index: {shift.rotation_index if shift.rotation_index is not None else '-'}"
         )
         summary = f"{self._name_prefix} {self._schedule.shift_name(shift.code)}"
-        return CalendarEvent(
+        event = CalendarEvent(
             summary=summary,
             start=shift.start,
             end=shift.end,
             description=description,
         )
+        if len(self._event_cache) >= EVENT_CACHE_SIZE:
+            # Drop the oldest entry; dicts keep insertion order
+            self._event_cache.pop(next(iter(self._event_cache)), None)
+        self._event_cache[key] = event
+        return event
 
     def _ensure_local(self, dt_value: datetime) -> datetime:
         """Normalize provided datetime to the integration timezone."""
-        if dt_value.tzinfo is None:
+        tzinfo = dt_value.tzinfo
+        if tzinfo is self._tz:
+            return dt_value
+        if tzinfo is None:
             dt_value = dt_value.replace(tzinfo=UTC)
-        return dt_value.astimezone(self._schedule.tz)
+        return dt_value.astimezone(self._tz)
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -185,12 +186,3 @@ class WorkshiftCalendarEntity(CalendarEntity):
             "schedule": self._config.get("schedule", ""),
             "schedule_start": self._config.get("schedule_start"),
         }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._device_name,
-            manufacturer="Workshift Sensor",
-        )
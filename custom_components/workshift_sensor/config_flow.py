@@ -1,6 +1,7 @@
 from __future__ import annotations
-from datetime import datetime, date, timedelta
-from typing import Any
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable
 import re
 import voluptuous as vol
 
@@ -21,6 +22,15 @@ from . import DOMAIN
 MAX_SCHEDULE_LENGTH = 365
 
 
+# Shift start time in HH:MM (leading zero of the hour optional)
+_HHMM_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)")
+
+# Translation tables deleting the digits allowed for 0..9 shifts per day
+_SCHEDULE_DIGIT_TABLES = tuple(
+    str.maketrans("", "", "0123456789"[: n + 1]) for n in range(10)
+)
+
+
 # FIX #5: Common validation function
 def _validate_schedule_pattern(pattern: str, num_shifts: int) -> tuple[bool, str]:
     """
@@ -38,7 +48,8 @@ def _validate_schedule_pattern(pattern: str, num_shifts: int) -> tuple[bool, str
     if len(pattern) > MAX_SCHEDULE_LENGTH:
         return False, "schedule_too_long"
     
-    if any(int(ch) > num_shifts for ch in pattern):
+    # Anything left after deleting the allowed digits is out of range
+    if pattern.translate(_SCHEDULE_DIGIT_TABLES[max(0, min(num_shifts, 9))]):
         return False, "invalid_schedule"
     
     return True, ""
@@ -57,12 +68,27 @@ CONF_MANUAL_DAYS_OFF = "manual_days_off"
 CONF_DAY_OFF_INPUT = "day_off_input"
 CONF_REMOVE_DAYS_OFF = "remove_days_off"
 
+DEFAULT_WORKDAY_SENSOR = "binary_sensor.workday_sensor"
+
+# Form field keys of the shift start times, one per possible shift (1-9)
+_START_TIME_KEYS = tuple(f"{CONF_START_TIMES}_{i}" for i in range(1, 10))
+
+# Form selectors are immutable, so every schema can share the same instances
+_TEXT_SELECTOR = selector.TextSelector()
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_BINARY_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="binary_sensor")
+)
+
+
+@lru_cache(maxsize=1)
+def _monday_of_week(week: int) -> str:
+    """Return the Monday of an ordinal week (ordinal 1 is a Monday)."""
+    return date.fromordinal(week * 7 + 1).isoformat()
+
 
 def _default_last_monday() -> str:
-    today = date.today()
-    days_since = today.weekday()
-    last_monday = today - timedelta(days=days_since)
-    return last_monday.strftime("%Y-%m-%d")
+    return _monday_of_week((date.today().toordinal() - 1) // 7)
 
 
 def _parse_day_off(text: str) -> list[dict[str, str]]:
@@ -86,9 +112,9 @@ def _parse_day_off(text: str) -> list[dict[str, str]]:
             raise vol.Invalid("invalid_day_off")
 
         try:
-            start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
-        except Exception as exc:
+            start_date = date.fromisoformat(start_str)
+            end_date = date.fromisoformat(end_str)
+        except ValueError as exc:
             raise vol.Invalid("invalid_day_off") from exc
 
         if end_date < start_date:
@@ -98,6 +124,21 @@ def _parse_day_off(text: str) -> list[dict[str, str]]:
     return parsed
 
 
+def _name_in_use(
+    entries: list[ConfigEntry], name: Any, exclude_entry_id: str | None
+) -> bool:
+    """Check whether a config entry other than the excluded one uses the name.
+
+    The options flow stores renames in the entry options, so those win over
+    the original data, with the entry title as the last resort.
+    """
+    return any(
+        (entry.options.get(CONF_NAME) or entry.data.get(CONF_NAME) or entry.title) == name
+        for entry in entries
+        if entry.entry_id != exclude_entry_id
+    )
+
+
 def _format_day_off(entry: dict[str, str]) -> str:
     start = entry.get("start")
     end = entry.get("end")
@@ -106,62 +147,96 @@ def _format_day_off(entry: dict[str, str]) -> str:
     return start or ""
 
 
-class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
-    VERSION = 1
-
-    def __init__(self):
-        self._data: dict[str, Any] = {}
-        self._reconfigure_entry: ConfigEntry | None = None
-
-    @staticmethod
-    async def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
-        """Return the options flow so the gear icon appears in the UI."""
-        return WorkshiftOptionsFlowHandler(config_entry)
-
-    async def async_step_reconfigure(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        """Allow reconfiguration of an existing entry."""
-        self._reconfigure_entry = self._get_reconfigure_entry()
-        self._data = {**self._reconfigure_entry.data, **self._reconfigure_entry.options}
-        self.context["title_placeholders"] = {"entry_name": self._reconfigure_entry.title}
-        return await self.async_step_user(user_input)
+@lru_cache(maxsize=32)
+def _user_schema(
+    name: str,
+    prefix: str,
+    use_workday: bool,
+    workday: str,
+    tomorrow: str,
+) -> vol.Schema:
+    """Build (once per defaults) the name and workday sensor form schema."""
+    return vol.Schema({
+        vol.Required(CONF_NAME, default=name): _TEXT_SELECTOR,
+        vol.Optional(CONF_NAME_PREFIX, default=prefix): _TEXT_SELECTOR,
+        vol.Required(CONF_USE_WORKDAY_SENSOR, default=use_workday): _BOOLEAN_SELECTOR,
+        vol.Required(CONF_WORKDAY_SENSOR, default=workday): _BINARY_SENSOR_SELECTOR,
+        vol.Optional(CONF_WORKDAY_SENSOR_TOMORROW, default=tomorrow): _BINARY_SENSOR_SELECTOR,
+    })
+
+
+@lru_cache(maxsize=32)
+def _shifts_schema(duration: int, num_shifts: int) -> vol.Schema:
+    """Build (once per defaults) the shift duration/count form schema."""
+    return vol.Schema({
+        vol.Required(CONF_SHIFT_DURATION, default=duration): vol.Coerce(int),
+        vol.Required(CONF_NUM_SHIFTS, default=num_shifts): vol.Coerce(int),
+    })
+
+
+@lru_cache(maxsize=32)
+def _default_start_times(num_shifts: int, duration: int) -> tuple[str, ...]:
+    """Suggest back-to-back shift starts from 06:00, wrapping past midnight."""
+    starts = []
+    for i in range(num_shifts):
+        minutes = (6 * 60 + duration * 60 * i) % (24 * 60)
+        starts.append(f"{minutes // 60:02d}:{minutes % 60:02d}")
+    return tuple(starts)
+
+
+@lru_cache(maxsize=32)
+def _start_times_schema(
+    num_shifts: int, duration: int, defaults: tuple[str, ...]
+) -> vol.Schema:
+    """Build (once per defaults) the shift start times form schema."""
+    # Stored times first, suggestions for any shifts added since
+    values = defaults[:num_shifts] + _default_start_times(num_shifts, duration)[len(defaults):]
+    return vol.Schema({
+        vol.Required(key, default=value): str
+        for key, value in zip(_START_TIME_KEYS[:num_shifts], values)
+    })
+
+
+@lru_cache(maxsize=32)
+def _schedule_schema(schedule_start: str, schedule: str) -> vol.Schema:
+    """Build (once per defaults) the schedule start/pattern form schema."""
+    return vol.Schema({
+        vol.Required(CONF_SCHEDULE_START, default=schedule_start): str,
+        vol.Required(CONF_SCHEDULE, default=schedule): str,
+    })
+
+
+class _WorkshiftFlowSteps:
+    """Form steps shared by the config flow and the options flow."""
+
+    # Provided by each flow: the collected data, the duplicate name check
+    # and the terminal action storing the data
+    _data: dict[str, Any]
+    _name_taken: Callable[[Any], bool]
+    _async_finish: Callable[[], ConfigFlowResult]
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         errors: dict[str, str] = {}
         if user_input is not None:
-            for entry in self._async_current_entries():
-                if (
-                    self.source == SOURCE_RECONFIGURE
-                    and self._reconfigure_entry
-                    and entry.entry_id == self._reconfigure_entry.entry_id
-                ):
-                    continue
-                if entry.data.get(CONF_NAME) == user_input[CONF_NAME]:
-                    errors["base"] = "name_exists"
-                    break
+            name = user_input[CONF_NAME]
+            # Keeping the entry's current name needs no lookup
+            if name != self._data.get(CONF_NAME) and self._name_taken(name):
+                errors["base"] = "name_exists"
             if not errors:
                 self._data.update(user_input)
                 return await self.async_step_shifts()
 
-        default_name = self._data.get(CONF_NAME, "")
-        default_prefix = self._data.get(CONF_NAME_PREFIX, "")
-        default_workday = self._data.get(CONF_WORKDAY_SENSOR, "binary_sensor.workday_sensor")
-        default_tomorrow = self._data.get(CONF_WORKDAY_SENSOR_TOMORROW, default_workday)
-        default_use_workday = self._data.get(CONF_USE_WORKDAY_SENSOR, True)
-        schema = vol.Schema({
-            vol.Required(CONF_NAME, default=default_name): selector.TextSelector(),
-            vol.Optional(CONF_NAME_PREFIX, default=default_prefix): selector.TextSelector(),
-            vol.Required(CONF_USE_WORKDAY_SENSOR, default=default_use_workday): selector.BooleanSelector(),
-            vol.Required(CONF_WORKDAY_SENSOR, default=default_workday): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor")
-            ),
-            vol.Optional(CONF_WORKDAY_SENSOR_TOMORROW, default=default_tomorrow): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor")
-            ),
-        })
+        data = self._data
+        default_workday = data.get(CONF_WORKDAY_SENSOR, DEFAULT_WORKDAY_SENSOR)
+        schema = _user_schema(
+            data.get(CONF_NAME, ""),
+            data.get(CONF_NAME_PREFIX, ""),
+            data.get(CONF_USE_WORKDAY_SENSOR, True),
+            default_workday,
+            data.get(CONF_WORKDAY_SENSOR_TOMORROW, default_workday),
+        )
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
     async def async_step_shifts(
@@ -176,10 +251,10 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._data.update(user_input)
                 return await self.async_step_start_times()
 
-        schema = vol.Schema({
-            vol.Required(CONF_SHIFT_DURATION, default=self._data.get(CONF_SHIFT_DURATION, 8)): vol.Coerce(int),
-            vol.Required(CONF_NUM_SHIFTS, default=self._data.get(CONF_NUM_SHIFTS, 3)): vol.Coerce(int),
-        })
+        schema = _shifts_schema(
+            self._data.get(CONF_SHIFT_DURATION, 8),
+            self._data.get(CONF_NUM_SHIFTS, 3),
+        )
         return self.async_show_form(step_id="shifts", data_schema=schema, errors=errors)
 
     async def async_step_start_times(
@@ -187,37 +262,29 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         errors: dict[str, str] = {}
         num_shifts = self._data.get(CONF_NUM_SHIFTS, 1)
-        defaults = self._data.get(CONF_START_TIMES, [])
-        schema_fields: dict = {}
-        base = datetime.strptime("06:00", "%H:%M")
-        duration = self._data.get(CONF_SHIFT_DURATION, 8)
-        for i in range(1, num_shifts + 1):
-            if i-1 < len(defaults):
-                default = defaults[i-1]
-            else:
-                default = (base + timedelta(hours=duration*(i-1))).strftime("%H:%M")
-            schema_fields[vol.Required(f"{CONF_START_TIMES}_{i}", default=default)] = str
-        schema = vol.Schema(schema_fields)
-
         if user_input is not None:
             times: list[str] = []
-            for i in range(1, num_shifts + 1):
-                t = user_input.get(f"{CONF_START_TIMES}_{i}")
-                try:
-                    datetime.strptime(t, "%H:%M")
-                except Exception:
+            prev_minutes = -1
+            for key in _START_TIME_KEYS[:num_shifts]:
+                t = user_input.get(key)
+                match = _HHMM_RE.fullmatch(t or "")
+                if match is None:
                     errors["base"] = "invalid_time_format"
+                    break
+                minutes = int(match[1]) * 60 + int(match[2])
+                if minutes <= prev_minutes:
+                    errors.setdefault("base", "times_not_sorted")
+                prev_minutes = minutes
                 times.append(t)
-            if not errors and any(
-                int(times[i].split(':')[0])*60+int(times[i].split(':')[1]) >=
-                int(times[i+1].split(':')[0])*60+int(times[i+1].split(':')[1])
-                for i in range(len(times)-1)
-            ):
-                errors["base"] = "times_not_sorted"
             if not errors:
                 self._data[CONF_START_TIMES] = times
                 return await self.async_step_schedule()
 
+        schema = _start_times_schema(
+            num_shifts,
+            self._data.get(CONF_SHIFT_DURATION, 8),
+            tuple(self._data.get(CONF_START_TIMES, [])),
+        )
         return self.async_show_form(step_id="start_times", data_schema=schema, errors=errors)
 
     async def async_step_schedule(
@@ -225,10 +292,13 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         errors: dict[str, str] = {}
         if user_input is not None:
-            date_str = user_input.get(CONF_SCHEDULE_START)
+            schedule_start: str | None = None
             try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except Exception:
+                # Store the canonical form so compact or week dates round-trip
+                schedule_start = date.fromisoformat(
+                    user_input.get(CONF_SCHEDULE_START)
+                ).isoformat()
+            except (TypeError, ValueError):
                 errors["base"] = "invalid_date"
             # FIX #5: Use common validation function
             sched = user_input.get(CONF_SCHEDULE, "")
@@ -239,14 +309,14 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
             if not is_valid:
                 errors["base"] = error_key
             if not errors:
-                self._data[CONF_SCHEDULE_START] = date_str
+                self._data[CONF_SCHEDULE_START] = schedule_start
                 self._data[CONF_SCHEDULE] = sched
                 return await self.async_step_days_off()
 
-        schema = vol.Schema({
-            vol.Required(CONF_SCHEDULE_START, default=self._data.get(CONF_SCHEDULE_START, _default_last_monday())): str,
-            vol.Required(CONF_SCHEDULE, default=self._data.get(CONF_SCHEDULE, "")): str,
-        })
+        schema = _schedule_schema(
+            self._data.get(CONF_SCHEDULE_START, _default_last_monday()),
+            self._data.get(CONF_SCHEDULE, ""),
+        )
         return self.async_show_form(
             step_id="schedule",
             data_schema=schema,
@@ -263,18 +333,6 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
         """Add or remove manual days off (single days or ranges)."""
         errors: dict[str, str] = {}
         current = self._data.get(CONF_MANUAL_DAYS_OFF, [])
-        options = [_format_day_off(item) for item in current if _format_day_off(item)]
-
-        schema = vol.Schema({
-            vol.Optional(CONF_DAY_OFF_INPUT, default=""): str,
-            vol.Optional(CONF_REMOVE_DAYS_OFF, default=[]): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=options,
-                    multiple=True,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        })
 
         if user_input is not None:
             updated = list(current)
@@ -293,16 +351,19 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
 
             if not errors:
                 self._data[CONF_MANUAL_DAYS_OFF] = updated
-                if self.source == SOURCE_RECONFIGURE and self._reconfigure_entry:
-                    options = {
-                        **self._reconfigure_entry.options,
-                        CONF_MANUAL_DAYS_OFF: self._data.get(CONF_MANUAL_DAYS_OFF, []),
-                    }
-                    return self.async_update_reload_and_abort(
-                        self._reconfigure_entry, data=self._data, options=options
-                    )
-                return self.async_create_entry(title=self._data[CONF_NAME], data=self._data)
+                return self._async_finish()
 
+        options = [_format_day_off(item) for item in current if _format_day_off(item)]
+        schema = vol.Schema({
+            vol.Optional(CONF_DAY_OFF_INPUT, default=""): str,
+            vol.Optional(CONF_REMOVE_DAYS_OFF, default=[]): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=options,
+                    multiple=True,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+        })
         return self.async_show_form(
             step_id="days_off",
             data_schema=schema,
@@ -314,188 +375,66 @@ class WorkshiftConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
-class WorkshiftOptionsFlowHandler(OptionsFlow):
-    """Options flow to manage manual days off."""
-
-    def __init__(self, entry: ConfigEntry) -> None:
-        self._entry = entry
-        self._data = {**entry.data, **entry.options}
-
-    async def async_step_init(self, user_input=None):
-        return await self.async_step_user(user_input)
-
-    async def async_step_user(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        errors: dict[str, str] = {}
-        if user_input is not None:
-            for entry in self.hass.config_entries.async_entries(DOMAIN):
-                if (
-                    entry.entry_id != self._entry.entry_id
-                    and entry.data.get(CONF_NAME) == user_input[CONF_NAME]
-                ):
-                    errors["base"] = "name_exists"
-                    break
-            if not errors:
-                self._data.update(user_input)
-                return await self.async_step_shifts()
-
-        default_name = self._data.get(CONF_NAME, "")
-        default_prefix = self._data.get(CONF_NAME_PREFIX, "")
-        default_workday = self._data.get(CONF_WORKDAY_SENSOR, "binary_sensor.workday_sensor")
-        default_tomorrow = self._data.get(CONF_WORKDAY_SENSOR_TOMORROW, default_workday)
-        default_use_workday = self._data.get(CONF_USE_WORKDAY_SENSOR, True)
-        schema = vol.Schema({
-            vol.Required(CONF_NAME, default=default_name): selector.TextSelector(),
-            vol.Optional(CONF_NAME_PREFIX, default=default_prefix): selector.TextSelector(),
-            vol.Required(CONF_USE_WORKDAY_SENSOR, default=default_use_workday): selector.BooleanSelector(),
-            vol.Required(CONF_WORKDAY_SENSOR, default=default_workday): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor")
-            ),
-            vol.Optional(CONF_WORKDAY_SENSOR_TOMORROW, default=default_tomorrow): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor")
-            ),
-        })
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
-
-    async def async_step_shifts(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        errors: dict[str, str] = {}
-        if user_input is not None:
-            num = user_input.get(CONF_NUM_SHIFTS)
-            if num is None or num < 1 or num > 9:
-                errors["base"] = "invalid_num_shifts"
-            if not errors:
-                self._data.update(user_input)
-                return await self.async_step_start_times()
-
-        schema = vol.Schema({
-            vol.Required(CONF_SHIFT_DURATION, default=self._data.get(CONF_SHIFT_DURATION, 8)): vol.Coerce(int),
-            vol.Required(CONF_NUM_SHIFTS, default=self._data.get(CONF_NUM_SHIFTS, 3)): vol.Coerce(int),
-        })
-        return self.async_show_form(step_id="shifts", data_schema=schema, errors=errors)
-
-    async def async_step_start_times(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        errors: dict[str, str] = {}
-        num_shifts = self._data.get(CONF_NUM_SHIFTS, 1)
-        defaults = self._data.get(CONF_START_TIMES, [])
-        schema_fields: dict = {}
-        base = datetime.strptime("06:00", "%H:%M")
-        duration = self._data.get(CONF_SHIFT_DURATION, 8)
-        for i in range(1, num_shifts + 1):
-            if i-1 < len(defaults):
-                default = defaults[i-1]
-            else:
-                default = (base + timedelta(hours=duration*(i-1))).strftime("%H:%M")
-            schema_fields[vol.Required(f"{CONF_START_TIMES}_{i}", default=default)] = str
-        schema = vol.Schema(schema_fields)
+class WorkshiftConfigFlow(_WorkshiftFlowSteps, ConfigFlow, domain=DOMAIN):
+    VERSION = 1
 
-        if user_input is not None:
-            times: list[str] = []
-            for i in range(1, num_shifts + 1):
-                t = user_input.get(f"{CONF_START_TIMES}_{i}")
-                try:
-                    datetime.strptime(t, "%H:%M")
-                except Exception:
-                    errors["base"] = "invalid_time_format"
-                times.append(t)
-            if not errors and any(
-                int(times[i].split(':')[0])*60+int(times[i].split(':')[1]) >=
-                int(times[i+1].split(':')[0])*60+int(times[i+1].split(':')[1])
-                for i in range(len(times)-1)
-            ):
-                errors["base"] = "times_not_sorted"
-            if not errors:
-                self._data[CONF_START_TIMES] = times
-                return await self.async_step_schedule()
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+        self._reconfigure_entry: ConfigEntry | None = None
 
-        return self.async_show_form(step_id="start_times", data_schema=schema, errors=errors)
+    @staticmethod
+    async def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow so the gear icon appears in the UI."""
+        return WorkshiftOptionsFlowHandler(config_entry)
 
-    async def async_step_schedule(
+    async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        errors: dict[str, str] = {}
-        if user_input is not None:
-            date_str = user_input.get(CONF_SCHEDULE_START)
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except Exception:
-                errors["base"] = "invalid_date"
-            # FIX #5: Use common validation function
-            sched = user_input.get(CONF_SCHEDULE, "")
-            is_valid, error_key = _validate_schedule_pattern(
-                sched, 
-                self._data.get(CONF_NUM_SHIFTS, 1)
-            )
-            if not is_valid:
-                errors["base"] = error_key
-            if not errors:
-                self._data[CONF_SCHEDULE_START] = date_str
-                self._data[CONF_SCHEDULE] = sched
-                return await self.async_step_days_off()
+        """Allow reconfiguration of an existing entry."""
+        self._reconfigure_entry = self._get_reconfigure_entry()
+        self._data = {**self._reconfigure_entry.data, **self._reconfigure_entry.options}
+        self.context["title_placeholders"] = {"entry_name": self._reconfigure_entry.title}
+        return await self.async_step_user(user_input)
 
-        schema = vol.Schema({
-            vol.Required(CONF_SCHEDULE_START, default=self._data.get(CONF_SCHEDULE_START, _default_last_monday())): str,
-            vol.Required(CONF_SCHEDULE, default=self._data.get(CONF_SCHEDULE, "")): str,
-        })
-        return self.async_show_form(
-            step_id="schedule",
-            data_schema=schema,
-            errors=errors,
-            description_placeholders={
-                "max": self._data.get(CONF_NUM_SHIFTS, 1),
-                "max_length": MAX_SCHEDULE_LENGTH
-            }
+    def _name_taken(self, name: Any) -> bool:
+        """Check whether another workshift entry already uses the name."""
+        exclude_entry_id = (
+            self._reconfigure_entry.entry_id
+            if self.source == SOURCE_RECONFIGURE and self._reconfigure_entry
+            else None
         )
+        return _name_in_use(self._async_current_entries(), name, exclude_entry_id)
+
+    def _async_finish(self) -> ConfigFlowResult:
+        """Create the entry, or update the one being reconfigured."""
+        if self.source == SOURCE_RECONFIGURE and self._reconfigure_entry:
+            options = {
+                **self._reconfigure_entry.options,
+                CONF_MANUAL_DAYS_OFF: self._data.get(CONF_MANUAL_DAYS_OFF, []),
+            }
+            return self.async_update_reload_and_abort(
+                self._reconfigure_entry, data=self._data, options=options
+            )
+        return self.async_create_entry(title=self._data[CONF_NAME], data=self._data)
 
-    async def async_step_days_off(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        errors: dict[str, str] = {}
-        current = self._data.get(CONF_MANUAL_DAYS_OFF, [])
-        options = [_format_day_off(item) for item in current if _format_day_off(item)]
 
-        schema = vol.Schema({
-            vol.Optional(CONF_DAY_OFF_INPUT, default=""): str,
-            vol.Optional(CONF_REMOVE_DAYS_OFF, default=[]): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=options,
-                    multiple=True,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        })
-
-        if user_input is not None:
-            updated = list(current)
-            to_remove = set(user_input.get(CONF_REMOVE_DAYS_OFF, []))
-            if to_remove:
-                updated = [item for item in updated if _format_day_off(item) not in to_remove]
+class WorkshiftOptionsFlowHandler(_WorkshiftFlowSteps, OptionsFlow):
+    """Options flow to manage manual days off."""
 
-            day_off_input = user_input.get(CONF_DAY_OFF_INPUT, "").strip()
-            if day_off_input:
-                try:
-                    parsed = _parse_day_off(day_off_input)
-                except vol.Invalid:
-                    errors["base"] = "invalid_day_off"
-                else:
-                    updated.extend(parsed)
+    def __init__(self, entry: ConfigEntry) -> None:
+        self._entry = entry
+        self._data = {**entry.data, **entry.options}
 
-            if not errors:
-                self._data[CONF_MANUAL_DAYS_OFF] = updated
-                # Options entries ignore the title, so set it to an empty string per HA convention.
-                return self.async_create_entry(title="", data=self._data)
+    async def async_step_init(self, user_input=None):
+        return await self.async_step_user(user_input)
 
-        return self.async_show_form(
-            step_id="days_off",
-            data_schema=schema,
-            errors=errors,
-            description_placeholders={
-                "examples": "2024-12-24, 2024-12-31 – 2025-01-02",
-                "current": "\n".join(options) if options else "-",
-            },
+    def _name_taken(self, name: Any) -> bool:
+        """Check whether another workshift entry already uses the name."""
+        return _name_in_use(
+            self.hass.config_entries.async_entries(DOMAIN), name, self._entry.entry_id
         )
 
+    def _async_finish(self) -> ConfigFlowResult:
+        """Save the updated options."""
+        # Options entries ignore the title, so set it to an empty string per HA convention.
+        return self.async_create_entry(title="", data=self._data)
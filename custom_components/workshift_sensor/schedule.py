@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import json
 import logging
 from importlib import resources
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for memoized per-day shifts kept by a schedule instance
+SHIFT_CACHE_SIZE = 512
+
 
 def _load_shift_label(lang: str) -> str | None:
     """Blocking translation loader executed in the executor."""
@@ -38,7 +43,36 @@ async def async_get_default_shift_label(hass: HomeAssistant) -> str:
     return label or "Shift"
 
 
-@dataclass
+def seconds_until(target: datetime, now: datetime) -> float:
+    """Return the real time in seconds from now until target.
+
+    Aware datetimes sharing a tzinfo subtract as wall-clock times, which is
+    off by the DST shift when a transition lies in between.
+    """
+    return target.timestamp() - now.timestamp()
+
+
+@lru_cache(maxsize=64)
+def _parse_start_time(value: str) -> time:
+    """Parse an HH:MM shift start, tolerating a missing leading zero.
+
+    Entries usually share the same few start times, so results are cached.
+    """
+    hours, sep, minutes = value.partition(":")
+    if sep and hours.isdigit() and minutes.isdigit() and len(minutes) == 2:
+        return time(int(hours), int(minutes))
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def _parse_schedule_start(value: str) -> date:
+    """Parse the rotation start date, tolerating unpadded legacy entries."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@dataclass(frozen=True, slots=True)
 class ShiftInstance:
     """Computed shift details for a specific date."""
 
@@ -64,31 +98,49 @@ class WorkshiftSchedule:
         self.tz = self._get_validated_timezone()
         
         self.shift_duration = int(self._config.get("shift_duration", 8))
+        self._shift_length = timedelta(hours=self.shift_duration)
         self._pattern = str(self._config.get("schedule", ""))
-        self._start_times = [
-            datetime.strptime(t, "%H:%M").time()
-            for t in self._config.get("start_times", [])
-        ]
+        self._pattern_codes = self._parse_pattern(self._pattern)
+        self._pattern_len = len(self._pattern_codes)
+        self._days_to_code = self._build_days_to_code(self._pattern_codes)
+        self._start_times = tuple(
+            _parse_start_time(t) for t in self._config.get("start_times", [])
+        )
+        # Minute of the day after which a shift started the previous day has
+        # certainly ended (one hour of slack covers DST transitions)
+        self._carryover_minutes = (
+            max(t.hour * 60 + t.minute for t in self._start_times)
+            + self.shift_duration * 60
+            - 24 * 60
+            + 60
+            if self._start_times
+            else 0
+        )
         
         # FIX #4: Error handling for date parsing
         try:
-            self._base_date = datetime.strptime(
-                self._config.get("schedule_start"), "%Y-%m-%d"
-            ).date()
+            self._base_date = _parse_schedule_start(self._config.get("schedule_start"))
         except (ValueError, TypeError) as err:
             _LOGGER.warning(
                 "Invalid schedule_start date, using today: %s", err
             )
             self._base_date = dt_util.now(self.tz).date()
         
+        self._base_ordinal = self._base_date.toordinal()
+        self._shift_cache: dict[date, Optional[ShiftInstance]] = {}
         self._manual_days_off = self._parse_manual_days_off(
             self._config.get("manual_days_off", [])
         )
+        self._off_starts, self._off_ends = self._index_days_off(self._manual_days_off)
         self._use_workday_sensor = self._config.get("use_workday_sensor", True)
         self._workday_today = self._config.get("workday_sensor")
         self._workday_tomorrow = (
             self._config.get("workday_sensor_tomorrow") or self._workday_today
         )
+        self._workday_enabled = bool(
+            self._use_workday_sensor
+            and (self._workday_today or self._workday_tomorrow)
+        )
         self._shift_names = self._config.get("shift_names") or []
         self._default_shift_label = (
             default_shift_label
@@ -109,6 +161,16 @@ class WorkshiftSchedule:
             )
             return ZoneInfo("UTC")
 
+    @property
+    def workday_entities(self) -> list[str]:
+        """Return the workday sensor entities that can override the schedule."""
+        if not self._workday_enabled:
+            return []
+        entities = [self._workday_today] if self._workday_today else []
+        if self._workday_tomorrow and self._workday_tomorrow != self._workday_today:
+            entities.append(self._workday_tomorrow)
+        return entities
+
     def shift_name(self, code: int) -> str:
         """Return a friendly shift name for the given code."""
         idx = code - 1
@@ -118,6 +180,23 @@ class WorkshiftSchedule:
 
     def get_shift(self, day: date) -> Optional[ShiftInstance]:
         """Return a computed shift for the given day, if any."""
+        return self._shift_for(day, self._workday_reference_day())
+
+    def _shift_for(self, day: date, today: Optional[date]) -> Optional[ShiftInstance]:
+        """Return the shift for a day against a precomputed workday reference."""
+        try:
+            shift = self._shift_cache[day]
+        except KeyError:
+            if len(self._shift_cache) >= SHIFT_CACHE_SIZE:
+                self._shift_cache.clear()
+            shift = self._shift_cache[day] = self._build_shift(day)
+        # Workday sensor states change at runtime, so they stay uncached
+        if shift is None or not self._workday_allowed(day, today):
+            return None
+        return shift
+
+    def _build_shift(self, day: date) -> Optional[ShiftInstance]:
+        """Compute the shift for a day from the pattern and manual days off."""
         code, rotation_index = self._get_schedule_code(day)
         if code == 0:
             return None
@@ -128,17 +207,20 @@ class WorkshiftSchedule:
             )
             return None
         start_dt = datetime.combine(day, self._start_times[idx], self.tz)
-        end_dt = start_dt + timedelta(hours=self.shift_duration)
+        end_dt = start_dt + self._shift_length
         return ShiftInstance(code=code, start=start_dt, end=end_dt, rotation_index=rotation_index)
 
     def shift_covering(self, moment: datetime) -> Optional[ShiftInstance]:
         """Return a shift that covers the provided moment."""
         localized = self._ensure_local(moment)
         day = localized.date()
-        today_shift = self.get_shift(day)
+        today = self._workday_reference_day()
+        today_shift = self._shift_for(day, today)
         if today_shift and today_shift.start <= localized < today_shift.end:
             return today_shift
-        yesterday_shift = self.get_shift(day - timedelta(days=1))
+        if localized.hour * 60 + localized.minute >= self._carryover_minutes:
+            return None
+        yesterday_shift = self._shift_for(day - timedelta(days=1), today)
         if yesterday_shift and yesterday_shift.start <= localized < yesterday_shift.end:
             return yesterday_shift
         return None
@@ -146,39 +228,102 @@ class WorkshiftSchedule:
     def next_shift_after(self, moment: datetime, search_days: int = 90) -> Optional[ShiftInstance]:
         """Return the first shift that ends after the given moment."""
         localized = self._ensure_local(moment)
+        if not self._days_to_code:
+            return None
         start_day = localized.date()
-        for offset in range(search_days):
+        today = self._workday_reference_day()
+        offset = 0
+        while offset < search_days:
             target = start_day + timedelta(days=offset)
-            shift = self.get_shift(target)
+            # Jump straight over days off in the rotation
+            skip = self._days_until_code(target)
+            if skip:
+                offset += skip
+                continue
+            shift = self._shift_for(target, today)
             if shift and shift.end > localized:
                 return shift
+            offset += 1
         return None
 
+    def shifts_between(self, start: datetime, end: datetime) -> list[ShiftInstance]:
+        """Return all shifts overlapping the [start, end) window in date order."""
+        start = self._ensure_local(start)
+        end = self._ensure_local(end)
+        shifts: list[ShiftInstance] = []
+        if not self._days_to_code or end <= start:
+            return shifts
+        today = self._workday_reference_day()
+        # Start a day early to catch a shift carried over from the previous day
+        day = start.date() - timedelta(days=1)
+        last_day = end.date()
+        while day <= last_day:
+            skip = self._days_until_code(day)
+            if skip:
+                day += timedelta(days=skip)
+                continue
+            shift = self._shift_for(day, today)
+            if shift is not None and shift.end > start and shift.start < end:
+                shifts.append(shift)
+            day += timedelta(days=1)
+        return shifts
+
     def _get_schedule_code(self, day: date) -> tuple[int, Optional[int]]:
-        """Get the shift code for a specific date with all overrides applied."""
+        """Get the shift code for a specific date with manual days off applied."""
         if self._is_manual_day_off(day):
             return 0, None
-        if not self._pattern:
+        if not self._pattern_len:
             return 0, None
-        diff = (day - self._base_date).days
+        diff = day.toordinal() - self._base_ordinal
         if diff < 0:
             return 0, None
-        try:
-            idx = diff % len(self._pattern)
-            code = int(self._pattern[idx])
-        except (ValueError, IndexError):
-            _LOGGER.warning("Invalid schedule pattern value for %s", day)
-            return 0, None
+        idx = diff % self._pattern_len
+        return self._pattern_codes[idx], idx
+
+    def _parse_pattern(self, pattern: str) -> tuple[int, ...]:
+        """Convert the schedule string to shift codes, treating invalid values as off."""
+        codes = tuple(int(ch) if ch in "0123456789" else 0 for ch in pattern)
+        if any(ch not in "0123456789" for ch in pattern):
+            _LOGGER.warning(
+                "Invalid schedule pattern values in %r treated as days off", pattern
+            )
+        return codes
+
+    @staticmethod
+    def _build_days_to_code(codes: tuple[int, ...]) -> tuple[int, ...]:
+        """For each pattern position, count days until a non-zero code (wrapping).
 
-        if not self._workday_allowed(day):
-            return 0, idx
-        return code, idx
+        Returns an empty tuple when the pattern has no working days.
+        """
+        if not any(codes):
+            return ()
+        length = len(codes)
+        days = [0] * length
+        next_code = 2 * length
+        for pos in range(2 * length - 1, -1, -1):
+            if codes[pos % length]:
+                next_code = pos
+            if pos < length:
+                days[pos] = next_code - pos
+        return tuple(days)
 
-    def _workday_allowed(self, day: date) -> bool:
+    def _days_until_code(self, day: date) -> int:
+        """Return how many days after the given date the rotation next has a shift."""
+        diff = day.toordinal() - self._base_ordinal
+        if diff < 0:
+            return -diff
+        return self._days_to_code[diff % self._pattern_len]
+
+    def _workday_reference_day(self) -> Optional[date]:
+        """Return today's date when workday sensors apply, otherwise None."""
+        if not self._workday_enabled:
+            return None
+        return dt_util.now(self.tz).date()
+
+    def _workday_allowed(self, day: date, today: Optional[date]) -> bool:
         """Check workday sensor states for the given day, if enabled."""
-        if not self._use_workday_sensor:
+        if today is None:
             return True
-        today = dt_util.now(self.tz).date()
         entity_id: Optional[str] = None
         if day == today:
             entity_id = self._workday_today
@@ -198,8 +343,8 @@ class WorkshiftSchedule:
             start = entry.get("start")
             end = entry.get("end", start)
             try:
-                start_date = datetime.strptime(start, "%Y-%m-%d").date()
-                end_date = datetime.strptime(end, "%Y-%m-%d").date()
+                start_date = date.fromisoformat(start)
+                end_date = date.fromisoformat(end)
             except (ValueError, TypeError) as err:
                 _LOGGER.warning("Invalid manual day off entry skipped: %s - %s", entry, err)
                 continue
@@ -208,17 +353,30 @@ class WorkshiftSchedule:
             ranges.append((start_date, end_date))
         return ranges
 
+    @staticmethod
+    def _index_days_off(
+        ranges: list[tuple[date, date]],
+    ) -> tuple[list[int], list[int]]:
+        """Merge day off ranges into sorted start/end ordinal lists for bisect."""
+        starts: list[int] = []
+        ends: list[int] = []
+        for start, end in sorted(ranges):
+            start_ord, end_ord = start.toordinal(), end.toordinal()
+            if ends and start_ord <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end_ord)
+            else:
+                starts.append(start_ord)
+                ends.append(end_ord)
+        return starts, ends
+
     def _is_manual_day_off(self, day: date) -> bool:
         """Check if date is marked as a manual day off."""
-        return any(start <= day <= end for start, end in self._manual_days_off)
+        ordinal = day.toordinal()
+        idx = bisect_right(self._off_starts, ordinal) - 1
+        return idx >= 0 and ordinal <= self._off_ends[idx]
 
     def _ensure_local(self, moment: datetime) -> datetime:
         """Return a timezone-aware datetime in the integration timezone."""
         if moment.tzinfo is None:
             return moment.replace(tzinfo=self.tz)
         return moment.astimezone(self.tz)
-
-    @callback
-    def async_update_timezone(self) -> None:
-        """Refresh timezone if Home Assistant time zone changes."""
-        self.tz = self._get_validated_timezone()
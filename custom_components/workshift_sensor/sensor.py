@@ -12,7 +12,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.util import dt as dt_util
 
-from . import DOMAIN
+from . import DATA_SCHEDULE, DOMAIN
 from .schedule import WorkshiftSchedule
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,25 +52,17 @@ class WorkshiftDaySensor(SensorEntity):
         self._attr_name = f"{name_prefix} {suffix.title()}"
         self._attr_unique_id = f"{entry.entry_id}_day_{suffix}"
         self._attr_extra_state_attributes: dict[str, Any] = {}
-        self._schedule = WorkshiftSchedule(hass, self._config)
-        self._device_name = base_name
+        self._schedule: WorkshiftSchedule = self._config[DATA_SCHEDULE]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=base_name,
+            manufacturer="Workshift Sensor",
+        )
 
         # FIX #2: Timer cancellation handlers
         self._midnight_cancel: Optional[Callable[[], None]] = None
         self._workday_cancel: Optional[Callable[[], None]] = None
 
-        self._use_workday_sensor = self._config.get("use_workday_sensor", True)
-        if self._use_workday_sensor:
-            if offset == 0:
-                self._workday_today = self._config.get("workday_sensor")
-                self._workday_tomorrow = self._config.get("workday_sensor_tomorrow") or self._workday_today
-            else:
-                self._workday_today = self._config.get("workday_sensor")
-                self._workday_tomorrow = self._config.get("workday_sensor_tomorrow") or self._workday_today
-        else:
-            self._workday_today = None
-            self._workday_tomorrow = None
-
     async def async_added_to_hass(self):
         """Odświeżenie o północy + nasłuchiwanie zmian workday_sensor."""
         self._update_state()
@@ -78,13 +70,7 @@ class WorkshiftDaySensor(SensorEntity):
 
         self._schedule_midnight_update()
 
-        entities: list[str] = []
-        if self._use_workday_sensor:
-            if self._workday_today:
-                entities.append(self._workday_today)
-            if self._workday_tomorrow and self._workday_tomorrow != self._workday_today:
-                entities.append(self._workday_tomorrow)
-
+        entities = self._schedule.workday_entities
         if entities:
             self._workday_cancel = async_track_state_change_event(
                 self.hass,
@@ -111,8 +97,8 @@ class WorkshiftDaySensor(SensorEntity):
 
         @callback
         def midnight_cb(ts: datetime):
-            self._update_state()
-            self.async_write_ha_state()
+            if self._update_state():
+                self.async_write_ha_state()
             self._schedule_midnight_update()
 
         self._midnight_cancel = async_track_point_in_utc_time(
@@ -124,33 +110,35 @@ class WorkshiftDaySensor(SensorEntity):
     @callback
     def _handle_workday_state_change(self, _event) -> None:
         """React to workday sensor updates."""
-        self._update_state()
-        self.async_write_ha_state()
+        if self._update_state():
+            self.async_write_ha_state()
+
+    def _update_state(self) -> bool:
+        """Ustawia wartość sensora i atrybuty startu/końca zmiany.
 
-    def _update_state(self):
-        """Ustawia wartość sensora i atrybuty startu/końca zmiany."""
+        Zwraca True, gdy wartość lub atrybuty uległy zmianie.
+        """
         today = dt_util.now(self._schedule.tz).date()
         target = today + timedelta(days=self._offset)
         shift = self._schedule.get_shift(target)
         if shift is None:
-            self._attr_native_value = 0
-            self._attr_extra_state_attributes = {
+            value = 0
+            attributes = {
                 "shift_start": None, 
                 "shift_end": None
             }
-            return
-
-        self._attr_native_value = shift.code
-        self._attr_extra_state_attributes = {
-            "shift_start": shift.start.isoformat(),
-            "shift_end": shift.end.isoformat(),
-        }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._device_name,
-            manufacturer="Workshift Sensor",
-        )
+        else:
+            value = shift.code
+            attributes = {
+                "shift_start": shift.start.isoformat(),
+                "shift_end": shift.end.isoformat(),
+            }
+
+        if (
+            value == self._attr_native_value
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return False
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        return True
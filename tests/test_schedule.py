@@ -8,6 +8,7 @@ from custom_components.workshift_sensor.schedule import (
     WorkshiftSchedule,
     ShiftInstance,
     async_get_default_shift_label,
+    seconds_until,
 )
 
 
@@ -47,6 +48,26 @@ class TestWorkshiftSchedule:
         assert len(schedule._start_times) == 3
         assert schedule.tz == ZoneInfo("Europe/Warsaw")
 
+    def test_start_times_without_leading_zero(self, mock_hass, basic_config):
+        """Test start times given as H:MM are still accepted."""
+        basic_config["start_times"] = ["6:00", "14:00", "22:00"]
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        shift = schedule.get_shift(date(2025, 1, 6))
+
+        assert shift.start.hour == 6
+        assert shift.start.minute == 0
+
+    def test_schedule_start_without_leading_zeros(self, mock_hass, basic_config):
+        """Test unpadded schedule start dates from older entries are accepted."""
+        basic_config["schedule_start"] = "2025-1-6"
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        shift = schedule.get_shift(date(2025, 1, 6))
+
+        assert schedule._base_date == date(2025, 1, 6)
+        assert shift.code == 1
+
     def test_get_shift_basic(self, mock_hass, basic_config):
         """Test basic shift calculation for a working day."""
         schedule = WorkshiftSchedule(mock_hass, basic_config)
@@ -104,6 +125,59 @@ class TestWorkshiftSchedule:
             shift = schedule.get_shift(target_day)
             assert shift is None, f"Day {target_day} should be off"
 
+    def test_manual_days_off_unsorted_overlapping(self, mock_hass, basic_config):
+        """Test overlapping and unsorted manual day off ranges."""
+        basic_config["manual_days_off"] = [
+            {"start": "2025-01-20", "end": "2025-01-18"},
+            {"start": "2025-01-06", "end": "2025-01-07"},
+            {"start": "2025-01-07", "end": "2025-01-08"},
+        ]
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        for day in (6, 7, 8, 18, 19, 20):
+            assert schedule._is_manual_day_off(date(2025, 1, day))
+        for day in (5, 9, 17, 21):
+            assert not schedule._is_manual_day_off(date(2025, 1, day))
+
+    def test_get_shift_is_memoized(self, mock_hass, basic_config):
+        """Test repeated lookups for a day reuse the computed shift."""
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        first = schedule.get_shift(date(2025, 1, 6))
+        second = schedule.get_shift(date(2025, 1, 6))
+
+        assert first is second
+
+    def test_workday_sensor_not_masked_by_cache(self, mock_hass, basic_config):
+        """Test workday sensor changes apply to already cached days."""
+        basic_config["schedule"] = "1"
+        basic_config["use_workday_sensor"] = True
+        basic_config["workday_sensor"] = "binary_sensor.workday_sensor"
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+        today = datetime.now(ZoneInfo("Europe/Warsaw")).date()
+
+        assert schedule.get_shift(today) is not None
+        mock_hass.states.get.return_value = Mock(state="off")
+        assert schedule.get_shift(today) is None
+        mock_hass.states.get.return_value = Mock(state="on")
+        assert schedule.get_shift(today) is not None
+
+    def test_workday_entities(self, mock_hass, basic_config):
+        """Test workday sensors exposed for state change tracking."""
+        assert WorkshiftSchedule(mock_hass, basic_config).workday_entities == []
+
+        basic_config["use_workday_sensor"] = True
+        basic_config["workday_sensor"] = "binary_sensor.workday_sensor"
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+        assert schedule.workday_entities == ["binary_sensor.workday_sensor"]
+
+        basic_config["workday_sensor_tomorrow"] = "binary_sensor.workday_tomorrow"
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+        assert schedule.workday_entities == [
+            "binary_sensor.workday_sensor",
+            "binary_sensor.workday_tomorrow",
+        ]
+
     def test_shift_covering_current_day(self, mock_hass, basic_config):
         """Test shift_covering for a moment within current day shift."""
         schedule = WorkshiftSchedule(mock_hass, basic_config)
@@ -130,6 +204,15 @@ class TestWorkshiftSchedule:
         assert shift.start.date() == date(2025, 1, 8)
         assert shift.end.date() == date(2025, 1, 9)
 
+    def test_shift_covering_after_overnight_shift_ended(self, mock_hass, basic_config):
+        """Test no shift covers a moment after the overnight shift ended."""
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        # Shift 3 from 2025-01-08 ended at 6:00, 2025-01-09 is a day off
+        moment = datetime(2025, 1, 9, 10, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw"))
+
+        assert schedule.shift_covering(moment) is None
+
     def test_next_shift_after(self, mock_hass, basic_config):
         """Test finding next shift after a given moment."""
         schedule = WorkshiftSchedule(mock_hass, basic_config)
@@ -142,6 +225,54 @@ class TestWorkshiftSchedule:
         assert next_shift.code == 2
         assert next_shift.start.hour == 14
 
+    def test_next_shift_after_skips_days_off(self, mock_hass, basic_config):
+        """Test next shift lookup across a long run of days off."""
+        basic_config["schedule"] = "2000000000"
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        moment = datetime(2025, 1, 6, 23, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw"))
+        next_shift = schedule.next_shift_after(moment)
+
+        assert next_shift is not None
+        assert next_shift.start.date() == date(2025, 1, 16)
+        assert next_shift.code == 2
+
+    def test_next_shift_after_before_schedule_start(self, mock_hass, basic_config):
+        """Test next shift lookup before the rotation has started."""
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+
+        moment = datetime(2024, 12, 20, 12, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw"))
+        next_shift = schedule.next_shift_after(moment)
+
+        assert next_shift is not None
+        assert next_shift.start.date() == date(2025, 1, 6)
+
+    def test_shifts_between(self, mock_hass, basic_config):
+        """Test listing shifts overlapping a time window."""
+        schedule = WorkshiftSchedule(mock_hass, basic_config)
+        tz = ZoneInfo("Europe/Warsaw")
+
+        # Window opens during the overnight shift from 2025-01-08
+        shifts = schedule.shifts_between(
+            datetime(2025, 1, 9, 0, 0, tzinfo=tz),
+            datetime(2025, 1, 12, 0, 0, tzinfo=tz),
+        )
+
+        assert [(s.start.date(), s.code) for s in shifts] == [
+            (date(2025, 1, 8), 3),
+            (date(2025, 1, 10), 1),
+            (date(2025, 1, 11), 2),
+        ]
+
+    def test_seconds_until_across_dst(self):
+        """Test delays use real elapsed time across a DST change."""
+        tz = ZoneInfo("Europe/Warsaw")
+        now = datetime(2026, 3, 28, 20, 0, tzinfo=tz)
+        target = datetime(2026, 3, 29, 6, 0, tzinfo=tz)
+
+        # Clocks jump forward an hour during the night
+        assert seconds_until(target, now) == 9 * 3600
+
     def test_shift_name_default(self, mock_hass, basic_config):
         """Test default shift naming."""
         schedule = WorkshiftSchedule(mock_hass, basic_config)